@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from hetdesrun.adapters.sql_adapter.load_table import load_table_from_provided_source_id
@@ -15,17 +16,29 @@ async def load_data(
     wf_input_name_to_filtered_source_mapping_dict: dict[str, FilteredSource],
     adapter_key: str,  # noqa: ARG001
 ) -> dict[str, Any]:
-    return {
-        wf_input_name: load_table_from_provided_source_id(
-            str(
-                filtered_source.ref_key
-                if filtered_source.ref_key is not None
-                else filtered_source.ref_id
-            ),
-            filtered_source.filters,
+    # offload the blocking pandas sql reads to threads so that the event loop
+    # is not stalled and multiple sources are loaded concurrently
+    loaded_data = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                load_table_from_provided_source_id,
+                str(
+                    filtered_source.ref_key
+                    if filtered_source.ref_key is not None
+                    else filtered_source.ref_id
+                ),
+                filtered_source.filters,
+            )
+            for filtered_source in wf_input_name_to_filtered_source_mapping_dict.values()
         )
-        for wf_input_name, filtered_source in wf_input_name_to_filtered_source_mapping_dict.items()
-    }
+    )
+    return dict(
+        zip(
+            wf_input_name_to_filtered_source_mapping_dict.keys(),
+            loaded_data,
+            strict=True,
+        )
+    )
 
 
 async def send_data(
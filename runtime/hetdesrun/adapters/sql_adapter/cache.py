@@ -0,0 +1,66 @@
+"""Small in-memory TTL cache for loaded sql adapter results
+
+Repeated requests for the same table or plain sql query source (e.g. from
+dashboard refreshes with identical filters) can be served from memory instead
+of hitting the database again. Caching is disabled by default and enabled per
+database via the cache_ttl_s config option.
+
+Cached dataframes are handed out as shallow copies: callers can add / drop /
+rename columns without affecting the cached result, while the underlying
+column data is shared to avoid duplicating memory.
+"""
+
+import threading
+import time
+
+import pandas as pd
+
+CacheKey = tuple[str, str, str]  # (db_key, "table" | "query", name / query text)
+
+_cache_lock = threading.Lock()
+
+# key -> (monotonic expiry timestamp, result dataframe)
+_result_cache: dict[CacheKey, tuple[float, pd.DataFrame]] = {}
+
+
+def get_cached_result(key: CacheKey) -> pd.DataFrame | None:
+    with _cache_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del _result_cache[key]
+            return None
+    return result.copy(deep=False)
+
+
+def put_cached_result(
+    key: CacheKey, result: pd.DataFrame, ttl_s: float, max_entries: int
+) -> None:
+    with _cache_lock:
+        if key not in _result_cache and len(_result_cache) >= max_entries:
+            # evict the entry closest to expiry
+            evicted_key = min(_result_cache, key=lambda k: _result_cache[k][0])
+            del _result_cache[evicted_key]
+        _result_cache[key] = (time.monotonic() + ttl_s, result)
+
+
+def invalidate_cached_results(db_key: str, table_name: str | None = None) -> None:
+    """Drop cached results of a database after it has been written to
+
+    All cached plain query results of the database are dropped since arbitrary
+    queries may touch the written table. Cached table results are only dropped
+    for the given table, or for all tables if table_name is None.
+    """
+    with _cache_lock:
+        for key in list(_result_cache):
+            if key[0] == db_key and (
+                key[1] == "query" or table_name is None or key[2] == table_name
+            ):
+                del _result_cache[key]
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _result_cache.clear()
@@ -1,6 +1,6 @@
 import os
 from functools import cached_property
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, BaseSettings, Field, validator
 from sqlalchemy import create_engine
@@ -98,18 +98,135 @@ class SQLAdapterDBConfig(BaseModel):
         ),
     )
 
+    read_autocommit: bool = Field(
+        False,
+        description=(
+            "Whether unchunked reads run through a separate engine in driver level"
+            " autocommit mode. This lets the backend skip transaction bookkeeping"
+            " for plain reads (e.g. Postgres avoids snapshot WAL writes, MySQL"
+            " skips gap locking). Chunked streaming reads keep using the default"
+            " engine since server side cursors usually require a transaction."
+        ),
+    )
+
+    allow_multi_statement: bool = Field(
+        False,
+        description=(
+            "Whether sql query sources may contain multiple ;-separated statements."
+            " Rejected by default since the query source is meant to read a single"
+            " result set and additional statements usually indicate mistakes or"
+            " injection attempts."
+        ),
+    )
+
+    cache_ttl_s: float | None = Field(
+        None,
+        description=(
+            "Time-to-live in seconds of the in-memory result cache for table and"
+            " plain sql query sources. Repeated requests for the same source within"
+            " the ttl (e.g. from dashboard refreshes) are then served from memory"
+            " instead of hitting the database. Cached results are invalidated when"
+            " this adapter instance itself writes to the database, but it cannot"
+            " see writes from elsewhere, hence caching is disabled by default"
+            " (null)."
+        ),
+    )
+
+    cache_max_entries: int = Field(
+        64,
+        description="Maximum number of cached results kept for this database.",
+    )
+
+    query_driver: Literal["default", "connectorx"] = Field(
+        "default",
+        description=(
+            "Which driver path is used for loading plain sql query sources."
+            ' "connectorx" fetches query results directly into Arrow record batches'
+            " in native code, which is typically several times faster than the"
+            " sqlalchemy+pandas path for large results, and requires the connectorx"
+            " package to be installed. Table and timeseries table sources as well as"
+            " all writing always go through sqlalchemy."
+        ),
+    )
+
+    read_chunksize: int | None = Field(
+        100_000,
+        description=(
+            "Number of rows fetched per chunk when reading tables and queries via pandas."
+            " Reading in chunks caps peak memory usage for large results since the"
+            " result set is not materialized twice in full."
+            " Set to null to read whole results at once."
+        ),
+    )
+
+    use_arrow_dtypes: bool = Field(
+        False,
+        description=(
+            "Whether dataframes are loaded with pyarrow backed dtypes"
+            ' (dtype_backend="pyarrow" of the pandas sql reading functions).'
+            " Arrow backed columns need a fraction of the memory of numpy object"
+            " columns for strings and speed up many subsequent operations, but"
+            " change the dtypes handed to workflows, therefore disabled by default."
+            " If enabled, downcast_dtypes is ignored since arrow dtypes are already"
+            " compact."
+        ),
+    )
+
+    downcast_dtypes: bool = Field(
+        False,
+        description=(
+            "Whether numeric columns of loaded dataframes are downcast to the smallest"
+            " fitting dtype and low-cardinality string columns are converted to"
+            " categoricals. This can shrink returned dataframes considerably but"
+            " changes the dtypes handed to workflows, therefore it is disabled by"
+            " default."
+        ),
+    )
+
     create_engine_kwargs: dict[str, Any] = Field(
         {},
         description=(
             "Additional keyword arguments to create_engine."
-            " E.g. you can set the connection pool size via pool_size."
+            " E.g. you can set the connection pool size via pool_size or driver"
+            " specific connect_args such as statement timeouts."
             " See sqlalchemy documentation for more options."
+            " pool_pre_ping (default true) and pool_recycle (default 3600) can be"
+            " overridden here."
         ),
     )
 
+    def complete_engine_kwargs(self) -> dict[str, Any]:
+        """create_engine keyword arguments including defaults
+
+        pool_pre_ping avoids errors from stale pooled connections after db
+        restarts or idle timeouts at the cost of a cheap ping per checkout.
+        pool_recycle replaces pooled connections before typical server side
+        idle connection timeouts kick in.
+        """
+        return {
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+            **self.create_engine_kwargs,
+        }
+
     @cached_property
     def engine(self) -> Engine:
-        return create_engine(self.connection_url, **self.create_engine_kwargs)  # type: ignore
+        return create_engine(self.connection_url, **self.complete_engine_kwargs())  # type: ignore
+
+    @cached_property
+    def read_engine(self) -> Engine:
+        """Engine used for unchunked reads
+
+        A separate engine in driver level autocommit mode if read_autocommit
+        is enabled, otherwise simply the default engine.
+        """
+        if not self.read_autocommit:
+            return self.engine
+        return create_engine(  # type: ignore
+            self.connection_url,
+            isolation_level="AUTOCOMMIT",
+            **self.complete_engine_kwargs(),
+        )
 
     class Config:
         arbitrary_types_allowed = True
@@ -1,19 +1,26 @@
 import datetime
+import json
 import logging
+from typing import Any
 
 import pandas as pd
 from pydantic import BaseModel, ValidationError
 from sqlalchemy.exc import OperationalError as SQLOpsError
-from sqlalchemy.sql import and_, column, select, table
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import and_, column, select, table, text
 from sqlalchemy.sql.selectable import Select
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.sql_adapter.cache import (
+    get_cached_result,
+    put_cached_result,
+)
 from hetdesrun.adapters.sql_adapter.config import (
     SQLAdapterDBConfig,
     TimeseriesTableConfig,
 )
 from hetdesrun.adapters.sql_adapter.utils import (
-    get_configured_dbs_by_key,
+    configured_dbs_by_key,
     validate_multits_frame,
 )
 
@@ -36,6 +43,55 @@ def split_metric_ids(metric_ids_string: str | None) -> list[str]:
         return [x.strip() for x in metric_ids_string.split(",") if x != ""]
 
 
+def parse_sql_query_params(params_string: str | None) -> dict[str, Any] | None:
+    """Parse the optional sql_query_params filter into a bind param dict"""
+    if params_string is None or params_string.strip() == "":
+        return None
+    try:
+        params = json.loads(params_string)
+    except json.JSONDecodeError as e:
+        msg = f"Could not parse sql_query_params filter as json: {str(e)}"
+        logger.info(msg)
+        raise AdapterHandlingException(msg) from e
+    if not isinstance(params, dict):
+        msg = (
+            "The sql_query_params filter must contain a json object mapping"
+            f" bind param names to values. Got: {params_string}"
+        )
+        logger.info(msg)
+        raise AdapterHandlingException(msg)
+    return params
+
+
+def reject_multi_statement_query(query: str) -> None:
+    """Reject query strings containing more than one sql statement
+
+    Scans for semicolons outside of single / double quoted sections. A single
+    trailing semicolon is allowed. This is a conservative guard, not a full sql
+    parser — semicolons inside comments are rejected as well.
+    """
+    in_single_quotes = False
+    in_double_quotes = False
+    for index, char in enumerate(query):
+        if char == "'" and not in_double_quotes:
+            in_single_quotes = not in_single_quotes
+        elif char == '"' and not in_single_quotes:
+            in_double_quotes = not in_double_quotes
+        elif (
+            char == ";"
+            and not in_single_quotes
+            and not in_double_quotes
+            and query[index + 1 :].strip() != ""
+        ):
+            msg = (
+                "Multi statement sql query scripts are not allowed for sql"
+                " query sources. Set allow_multi_statement in the db config"
+                " to allow them."
+            )
+            logger.info(msg)
+            raise AdapterHandlingException(msg)
+
+
 def extract_time_range(
     source_filters: dict[str, str]
 ) -> tuple[datetime.datetime, datetime.datetime]:
@@ -151,21 +207,22 @@ def prepare_validate_loaded_raw_multitsframe(
 def load_table_from_provided_source_id(
     source_id: str, source_filters: dict
 ) -> pd.DataFrame:
-    configured_dbs_by_key = get_configured_dbs_by_key()
-
-    id_split = source_id.split("/", 2)
-    db_key = id_split[0]
-
-    if db_key not in configured_dbs_by_key or len(id_split) < 2:
+    # partition instead of split: fixed 3-tuples unpacked into named locals,
+    # no list allocation and no bounds checks in the dispatch branches
+    db_key, first_sep, rest = source_id.partition("/")
+    kind, second_sep, name_part = rest.partition("/")
+    has_name_part = second_sep != ""
+
+    # single dict lookup via .get instead of a membership check plus indexing
+    db_config = configured_dbs_by_key.get(db_key)
+    if db_config is None or not first_sep:
         msg = f"Invalid source id requested from sql adapter: {source_id}"
         logger.info(msg)
         raise AdapterHandlingException(msg)
 
-    db_config = configured_dbs_by_key[db_key]
-
-    if id_split[1] == "query" and len(id_split) == 2:
+    if kind == "query" and not has_name_part:
         query = source_filters.get("sql_query", None)
-        if query is None:  # pragma: no cover
+        if query is None:
             msg = (
                 "Source of type query from sql adapter but no sql_query filter!\n"
                 f"Source id: {source_id}\n"
@@ -173,14 +230,16 @@ def load_table_from_provided_source_id(
             )
             logger.info(msg)
             raise AdapterHandlingException(msg)
-        return load_sql_query(db_config, query)
+        params = parse_sql_query_params(source_filters.get("sql_query_params", None))
+        if not db_config.allow_multi_statement:
+            reject_multi_statement_query(query)
+        return load_sql_query(db_config, query, params=params)
 
-    if id_split[1] == "table" and len(id_split) > 2:
-        table_name = id_split[2]
-        return load_sql_table(db_config, table_name)
+    if kind == "table" and has_name_part:
+        return load_sql_table(db_config, name_part)
 
-    if id_split[1] == "ts_table" and len(id_split) > 2:
-        ts_table_name = id_split[2]
+    if kind == "ts_table" and has_name_part:
+        ts_table_name = name_part
 
         metric_ids_string = source_filters.get("metrics", "")
 
@@ -224,25 +283,213 @@ def load_table_from_provided_source_id(
     raise AdapterHandlingException(msg)
 
 
+def downcast_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink the memory footprint of a loaded dataframe
+
+    Numeric columns are downcast to the smallest fitting dtype and
+    low-cardinality object (string) columns are converted to categoricals.
+    """
+    for col_name in df.columns:
+        col = df[col_name]
+        if pd.api.types.is_integer_dtype(col.dtype):
+            df[col_name] = pd.to_numeric(col, downcast="integer")
+        elif pd.api.types.is_float_dtype(col.dtype):
+            df[col_name] = pd.to_numeric(col, downcast="float")
+        elif (
+            pd.api.types.is_object_dtype(col.dtype)
+            and len(col) > 0
+            and col.nunique() < 0.5 * len(col)
+        ):
+            df[col_name] = col.astype("category")
+    return df
+
+
+def concat_chunks(chunks: list[pd.DataFrame]) -> pd.DataFrame:
+    """Combine the chunks of a chunked pandas sql read into a single dataframe
+
+    Concatenating once instead of growing a dataframe keeps peak memory bounded
+    by the result size plus one chunk.
+    """
+    if len(chunks) == 0:  # pragma: no cover
+        return pd.DataFrame()
+    return pd.concat(chunks, copy=False, ignore_index=True)
+
+
+def pandas_read_kwargs(db_config: SQLAdapterDBConfig) -> dict[str, str]:
+    """Common optional keyword arguments for the pandas sql reading functions"""
+    if db_config.use_arrow_dtypes:
+        return {"dtype_backend": "pyarrow"}
+    return {}
+
+
 def load_sql_table(db_config: SQLAdapterDBConfig, table_name: str) -> pd.DataFrame:
-    engine = db_config.engine
+    cache_ttl_s = db_config.cache_ttl_s
+    if cache_ttl_s is not None:
+        cache_key = (db_config.key, "table", table_name)
+        cached_result = get_cached_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+    result = read_sql_table(db_config, table_name)
+
+    if cache_ttl_s is not None:
+        put_cached_result(cache_key, result, cache_ttl_s, db_config.cache_max_entries)
+        return result.copy(deep=False)
+    return result
+
+
+def read_sql_table(db_config: SQLAdapterDBConfig, table_name: str) -> pd.DataFrame:
+    # table reads never use server side cursors, so the (possibly autocommit)
+    # read engine can be used for both the chunked and the unchunked path
+    engine = db_config.read_engine
+    chunksize = db_config.read_chunksize
+    read_kwargs = pandas_read_kwargs(db_config)
     try:
         with engine.begin():
-            result = pd.read_sql_table(table_name, engine)
+            if chunksize is None:
+                result = pd.read_sql_table(table_name, engine, **read_kwargs)
+            else:
+                result = concat_chunks(
+                    list(
+                        pd.read_sql_table(
+                            table_name, engine, chunksize=chunksize, **read_kwargs
+                        )
+                    )
+                )
     except SQLOpsError as e:
-        msg = f"Sql adapter pandas sql reading error: {str(e)}"
+        # lazy %-formatting: sqlalchemy error strings can be huge (full query
+        # plus params), only pay for formatting when the log level is enabled
+        logger.info("Sql adapter pandas sql reading error: %s", e)
+        raise AdapterHandlingException(
+            f"Sql adapter pandas sql reading error: {e!s}"
+        ) from e
+    if db_config.downcast_dtypes and not db_config.use_arrow_dtypes:
+        result = downcast_dataframe(result)
+    return result
+
+
+def load_query_via_connectorx(
+    db_config: SQLAdapterDBConfig, query: str
+) -> pd.DataFrame:
+    """Load a plain sql query via the connectorx driver
+
+    Connectorx fetches the result directly into Arrow record batches in native
+    code instead of going row-by-row through the DBAPI, avoiding per-cell Python
+    object boxing.
+    """
+    try:
+        import connectorx as cx
+    except ImportError as e:
+        msg = (
+            f'Driver "connectorx" configured for sql adapter db {db_config.key}'
+            " but the connectorx package is not installed."
+        )
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
+
+    try:
+        arrow_table = cx.read_sql(db_config.connection_url, query, return_type="arrow")
+    except (RuntimeError, ValueError) as e:
+        logger.info("Sql adapter connectorx sql query error: %s", e)
+        raise AdapterHandlingException(
+            f"Sql adapter connectorx sql query error: {e!s}"
+        ) from e
+
+    if db_config.use_arrow_dtypes:
+        return arrow_table.to_pandas(types_mapper=pd.ArrowDtype)
+    result = arrow_table.to_pandas()
+    if db_config.downcast_dtypes:
+        result = downcast_dataframe(result)
     return result
 
 
-def load_sql_query(db_config: SQLAdapterDBConfig, query: Select) -> pd.DataFrame:
+def load_sql_query(
+    db_config: SQLAdapterDBConfig,
+    query: str | Select,
+    params: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    # Only plain string queries are cached: the sqlalchemy statements built for
+    # timeseries table sources carry their time range filters as bind params
+    # which are not part of their string representation.
+    cache_key = None
+    cache_ttl_s = db_config.cache_ttl_s if isinstance(query, str) else None
+    if cache_ttl_s is not None and isinstance(query, str):
+        query_text: str = (
+            query
+            if params is None
+            else query + "\n-- params: " + repr(sorted(params.items()))
+        )
+        cache_key = (db_config.key, "query", query_text)
+        cached_result = get_cached_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+    result = run_sql_query(db_config, query, params=params)
+
+    if cache_ttl_s is not None and cache_key is not None:
+        put_cached_result(cache_key, result, cache_ttl_s, db_config.cache_max_entries)
+        return result.copy(deep=False)
+    return result
+
+
+def run_sql_query(
+    db_config: SQLAdapterDBConfig,
+    query: str | Select,
+    params: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    # connectorx has no bind param support, so parameterized queries always
+    # use the sqlalchemy path
+    if (
+        db_config.query_driver == "connectorx"
+        and isinstance(query, str)
+        and params is None
+    ):
+        return load_query_via_connectorx(db_config, query)
+
     engine = db_config.engine
+    chunksize = db_config.read_chunksize
+    read_kwargs = pandas_read_kwargs(db_config)
+
+    # Only wrap in text() when bind params are actually provided: text()
+    # interprets every unquoted :name token, which could reinterpret contents
+    # of plain queries that were never meant to be parameterized.
+    statement = text(query) if params is not None and isinstance(query, str) else query
+
     try:
-        with engine.begin():
-            result = pd.read_sql_query(query, engine)
-    except SQLOpsError as e:
-        msg = f"Sql adapter pandas sql query error: {str(e)}"
-        logger.info(msg)
-        raise AdapterHandlingException(msg) from e
+        if chunksize is None:
+            read_engine = db_config.read_engine
+            with read_engine.begin():
+                result = pd.read_sql_query(
+                    statement, read_engine, params=params, **read_kwargs
+                )
+        else:
+            # Combined with chunksize a server-side cursor keeps client-side
+            # memory bounded by chunksize rows regardless of result size.
+            # Sqlite has no server-side cursors, there streaming is a no-op.
+            stream_results = engine.dialect.name != "sqlite"
+            with engine.connect().execution_options(
+                stream_results=stream_results, max_row_buffer=chunksize
+            ) as connection:
+                result = concat_chunks(
+                    list(
+                        pd.read_sql_query(
+                            statement,
+                            connection,
+                            params=params,
+                            chunksize=chunksize,
+                            **read_kwargs,
+                        )
+                    )
+                )
+    except SQLAlchemyError as e:
+        # SQLAlchemyError instead of only OperationalError: bind param
+        # mistakes from the sql_query_params filter surface as StatementError
+        # or ProgrammingError and must become an AdapterHandlingException like
+        # every other user-input error of this adapter.
+        logger.info("Sql adapter pandas sql query error: %s", e)
+        raise AdapterHandlingException(
+            f"Sql adapter pandas sql query error: {e!s}"
+        ) from e
+    if db_config.downcast_dtypes and not db_config.use_arrow_dtypes:
+        result = downcast_dataframe(result)
     return result
@@ -2,7 +2,7 @@ import logging
 from collections.abc import Iterable
 
 from pydantic import ValidationError
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import inspect
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
@@ -23,9 +23,10 @@ from hetdesrun.adapters.sql_adapter.utils import get_configured_dbs_by_key
 logger = logging.getLogger(__name__)
 
 
-def get_table_names(uri: str) -> list[str]:
-    engine = create_engine(uri)
-    inspection = inspect(engine)
+def get_table_names(db_config: SQLAdapterDBConfig) -> list[str]:
+    # use the cached engine of the db config instead of constructing a new
+    # engine (and connection pool) on every structure request
+    inspection = inspect(db_config.engine)
     return inspection.get_table_names()
 
 
@@ -45,7 +46,7 @@ def is_allowed_dataframe_source_table(
 def get_allowed_dataframe_source_tables(db_config: SQLAdapterDBConfig) -> list[str]:
     return [
         table_name
-        for table_name in get_table_names(db_config.connection_url)
+        for table_name in get_table_names(db_config)
         if is_allowed_dataframe_source_table(table_name, db_config)
     ]
 
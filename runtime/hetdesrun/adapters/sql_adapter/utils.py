@@ -1,4 +1,5 @@
-import functools
+import atexit
+import re
 
 import pandas as pd
 from pydantic import BaseModel
@@ -14,22 +15,66 @@ class CorrectMultiTSFrame(BaseModel):
     multi_ts_frame: PydanticMultiTimeseriesPandasDataFrame
 
 
+# precompiled patterns for single-pass conversion instead of chained
+# str.replace calls which each scan and allocate anew
+_ENCODE_RE = re.compile(r"[_/]")
+_ENCODE_MAP = {"_": "-_-", "/": "__"}
+_DECODE_RE = re.compile(r"-_-|__")
+_DECODE_MAP = {"-_-": "_", "__": "/"}
+
+
 def to_url_representation(path: str) -> str:
     """Convert path to a representation that can be used in urls/queries"""
-    return path.replace("_", "-_-").replace("/", "__")
+    return _ENCODE_RE.sub(lambda match: _ENCODE_MAP[match.group(0)], path)
 
 
 def from_url_representation(url_rep: str) -> str:
     """Reconvert url representation of path to actual path"""
-    return url_rep.replace("__", "/").replace("-_-", "_")
+    return _DECODE_RE.sub(lambda match: _DECODE_MAP[match.group(0)], url_rep)
 
 
-@functools.cache
-def get_configured_dbs_by_key() -> dict[str, SQLAdapterDBConfig]:
-    return {
-        configured_db.key: configured_db
+# precomputed at import time so that the hot load path pays neither the dict
+# construction nor a cache wrapper indirection per call
+configured_dbs_by_key: dict[str, SQLAdapterDBConfig] = {}
+
+
+def refresh_configured_dbs_by_key() -> None:
+    """Recompute the db config lookup from the current adapter config
+
+    Mutates the lookup dict in place so that direct references stay valid.
+    Only needed after reconfiguration at runtime, e.g. in tests.
+    """
+    configured_dbs_by_key.clear()
+    configured_dbs_by_key.update(
+        (configured_db.key, configured_db)
         for configured_db in get_sql_adapter_config().sql_databases
-    }
+    )
+
+
+refresh_configured_dbs_by_key()
+
+
+def get_configured_dbs_by_key() -> dict[str, SQLAdapterDBConfig]:
+    return configured_dbs_by_key
+
+
+def dispose_engines() -> None:
+    """Dispose the connection pools of all db engines created so far
+
+    Registered as atexit hook so that pooled connections are closed cleanly
+    on shutdown / worker reloads.
+    """
+    for db_config in get_configured_dbs_by_key().values():
+        # the engines are cached_properties, only dispose engines actually created
+        engine = db_config.__dict__.get("engine")
+        read_engine = db_config.__dict__.get("read_engine")
+        if read_engine is not None and read_engine is not engine:
+            read_engine.dispose()
+        if engine is not None:
+            engine.dispose()
+
+
+atexit.register(dispose_engines)
 
 
 def validate_multits_frame(df: pd.DataFrame) -> pd.DataFrame:
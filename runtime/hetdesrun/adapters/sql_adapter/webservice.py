@@ -8,7 +8,8 @@ Actual data ingestion/egestion happens in the corresponding Runtime-Python-Plugi
 """
 
 
-from fastapi import HTTPException, Query
+from fastapi import HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 
 from hetdesrun.adapters.sql_adapter import VERSION
 from hetdesrun.adapters.sql_adapter.models import (
@@ -32,9 +33,27 @@ from hetdesrun.adapters.sql_adapter.utils import from_url_representation
 from hetdesrun.webservice.auth_dependency import get_auth_deps
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
+# Use the much faster orjson based serialization for responses if available.
+# Especially the structure / sources endpoints can have large payloads for
+# which the default json encoding dominates endpoint latency.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+
+    default_response_class: type[JSONResponse] = ORJSONResponse
+except ImportError:  # pragma: no cover
+    default_response_class = JSONResponse
+
+# Shared pre-encoded response for the metadata endpoints which always return
+# an empty list. Returning it directly skips response model validation and
+# json encoding on every call.
+_EMPTY_LIST_RESPONSE = Response(content=b"[]", media_type="application/json")
+
 # Note: As CORS middleware the router employs the main FastAPI app's one
 sql_adapter_router = HandleTrailingSlashAPIRouter(
-    prefix="/adapters/sql", tags=["sql adapter"]
+    prefix="/adapters/sql",
+    tags=["sql adapter"],
+    default_response_class=default_response_class,
 )
 
 
@@ -88,18 +107,17 @@ async def get_sinks_endpoint(
 
 @sql_adapter_router.get(
     "/sources/{sourceId:path}/metadata/",
-    response_model=list,
     dependencies=get_auth_deps(),
 )
 async def get_sources_metadata(
     sourceId: str,  # noqa: ARG001
-) -> list:
+) -> Response:
     """Get metadata attached to sources
 
     This adapter does not implement metadata. Therefore this will always result
     in an empty list!
     """
-    return []
+    return _EMPTY_LIST_RESPONSE
 
 
 @sql_adapter_router.get(
@@ -122,16 +140,15 @@ async def get_single_source(source_id: str) -> SQLAdapterStructureSource:
 
 @sql_adapter_router.get(
     "/sinks/{sinkId:path}/metadata/",
-    response_model=list,
     dependencies=get_auth_deps(),
 )
-async def get_sinks_metadata(sinkId: str) -> list:  # noqa: ARG001
+async def get_sinks_metadata(sinkId: str) -> Response:  # noqa: ARG001
     """Get metadata attached to sinks
 
     This adapter does not implement metadata. Therefore this will always result
     in an empty list!
     """
-    return []
+    return _EMPTY_LIST_RESPONSE
 
 
 @sql_adapter_router.get(
@@ -154,18 +171,17 @@ async def get_single_sink(sink_id: str) -> SQLAdapterStructureSink:
 
 @sql_adapter_router.get(
     "/thingNodes/{thingNodeId}/metadata/",
-    response_model=list,
     dependencies=get_auth_deps(),
 )
 async def get_thing_nodes_metadata(
     thingNodeId: str,  # noqa: ARG001
-) -> list:
+) -> Response:
     """Get metadata attached to thing Nodes.
 
     This adapter does not implement metadata. Therefore this will always result
     in an empty list!
     """
-    return []
+    return _EMPTY_LIST_RESPONSE
 
 
 @sql_adapter_router.get(
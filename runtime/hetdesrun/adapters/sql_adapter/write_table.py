@@ -5,6 +5,7 @@ from pydantic import ValidationError
 from sqlalchemy.exc import OperationalError as SQLOpsError
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.sql_adapter.cache import invalidate_cached_results
 from hetdesrun.adapters.sql_adapter.config import TimeseriesTableConfig
 from hetdesrun.adapters.sql_adapter.models import WriteTable, WriteTableMode
 from hetdesrun.adapters.sql_adapter.utils import (
@@ -107,6 +108,9 @@ def write_table_to_provided_sink_id(data: pd.DataFrame, sink_id: str) -> None:
                 method="multi",
             )
     except SQLOpsError as e:
-        msg = f"Sql adapter pandas to_sql writing error: {str(e)}"
-        logger.info(msg)
-        raise AdapterHandlingException(msg) from e
+        logger.info("Sql adapter pandas to_sql writing error: %s", e)
+        raise AdapterHandlingException(
+            f"Sql adapter pandas to_sql writing error: {e!s}"
+        ) from e
+
+    invalidate_cached_results(write_table.db_key, write_table.table_name)
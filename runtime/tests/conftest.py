@@ -24,13 +24,23 @@ def test_db_engine(use_in_memory_db: bool) -> Engine:
     return engine
 
 
-@pytest.fixture()
-def clean_test_db_engine(test_db_engine: Engine) -> Engine:
+@pytest.fixture(scope="session")
+def test_db_engine_with_tables(test_db_engine: Engine) -> Engine:
     Base.metadata.drop_all(test_db_engine)
     Base.metadata.create_all(test_db_engine)
     return test_db_engine
 
 
+@pytest.fixture()
+def clean_test_db_engine(test_db_engine_with_tables: Engine) -> Engine:
+    # the tables are created once per session, per test it suffices to empty
+    # them, which is much cheaper than the previous drop_all + create_all
+    with test_db_engine_with_tables.begin() as connection:
+        for db_table in reversed(Base.metadata.sorted_tables):
+            connection.execute(db_table.delete())
+    return test_db_engine_with_tables
+
+
 @pytest.fixture()
 def mocked_clean_test_db_session(clean_test_db_engine):
     with mock.patch(
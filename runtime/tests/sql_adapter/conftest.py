@@ -7,14 +7,22 @@ from fastapi import FastAPI
 from httpx import AsyncClient
 from sqlalchemy import create_engine
 
+from hetdesrun.adapters.sql_adapter.cache import clear_cache
 from hetdesrun.adapters.sql_adapter.config import (
     SQLAdapterDBConfig,
     TimeseriesTableConfig,
 )
-from hetdesrun.adapters.sql_adapter.utils import get_configured_dbs_by_key
+from hetdesrun.adapters.sql_adapter.utils import refresh_configured_dbs_by_key
 from hetdesrun.webservice.application import init_app
 
 
+@pytest.fixture(autouse=True)
+def _clean_sql_adapter_result_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
 @pytest.fixture(scope="function")  # noqa: PT003
 def temporary_sqlite_file_path(tmpdir):
     return os.path.join(tmpdir, "temporary_sqlite.db")
@@ -87,12 +95,7 @@ def temporary_prefilled_sqlite_ts_db(temporary_sqlite_file_path_ts_db):
 
 
 @pytest.fixture(scope="function")  # noqa: PT003
-def _clean_configured_dbs_by_key():
-    get_configured_dbs_by_key.cache_clear()
-
-
-@pytest.fixture(scope="function")  # noqa: PT003
-def two_sqlite_dbs_configured(temporary_sqlite_file_path, _clean_configured_dbs_by_key):
+def two_sqlite_dbs_configured(temporary_sqlite_file_path):
     with mock.patch(
         "hetdesrun.adapters.sql_adapter.config.sql_adapter_config.sql_databases",
         new=[
@@ -110,14 +113,15 @@ def two_sqlite_dbs_configured(temporary_sqlite_file_path, _clean_configured_dbs_
             ),
         ],
     ) as _fixture:
+        refresh_configured_dbs_by_key()
         yield _fixture
+    refresh_configured_dbs_by_key()
 
 
 @pytest.fixture(scope="function")  # noqa: PT003
 def three_sqlite_dbs_configured(
     temporary_sqlite_file_path,
     temporary_prefilled_sqlite_ts_db,
-    _clean_configured_dbs_by_key,
 ):
     with mock.patch(
         "hetdesrun.adapters.sql_adapter.config.sql_adapter_config.sql_databases",
@@ -159,7 +163,9 @@ def three_sqlite_dbs_configured(
             ),
         ],
     ) as _fixture:
+        refresh_configured_dbs_by_key()
         yield _fixture
+    refresh_configured_dbs_by_key()
 
 
 @pytest.fixture(scope="session")
@@ -6,12 +6,24 @@ from hetdesrun.adapters.sql_adapter.structure import (
     get_sources,
     get_structure,
 )
+from hetdesrun.adapters.sql_adapter.utils import (
+    from_url_representation,
+    to_url_representation,
+)
 
 
 def test_config_works(two_sqlite_dbs_configured):
     assert len(get_sql_adapter_config().sql_databases) == 2
 
 
+def test_url_representation_roundtrip():
+    for path in ["some/table_name", "_/", "/_", "a__b", "no-special-chars", ""]:
+        assert from_url_representation(to_url_representation(path)) == path
+
+    assert to_url_representation("some/table_name") == "some__table-_-name"
+    assert from_url_representation("some__table-_-name") == "some/table_name"
+
+
 def test_sql_adapter_structure(two_sqlite_dbs_configured):
     structure_results = get_structure()
     assert len(structure_results.thingNodes) == 2
@@ -1,10 +1,109 @@
+from unittest import mock
+
 import pandas as pd
 import pytest
 
+from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.sql_adapter import load_data, send_data
+from hetdesrun.adapters.sql_adapter.utils import get_configured_dbs_by_key
 from hetdesrun.models.data_selection import FilteredSink, FilteredSource
 
 
+@pytest.mark.asyncio
+async def test_load_table_in_chunks(two_sqlite_dbs_configured):
+    db_config = get_configured_dbs_by_key()["test_example_sqlite_read_db"]
+    with mock.patch.object(db_config, "read_chunksize", 2):
+        received_data = await load_data(
+            {
+                "inp": FilteredSource(
+                    ref_id="test_example_sqlite_read_db/table/data_table",
+                    ref_id_type="SOURCE",
+                )
+            },
+            adapter_key="sql-adapter",
+        )
+
+    dataframe = received_data["inp"]
+    assert isinstance(dataframe, pd.DataFrame)
+    assert len(dataframe) == 3
+    assert (dataframe.index == pd.RangeIndex(3)).all()
+
+
+@pytest.mark.asyncio
+async def test_load_table_with_downcasting(two_sqlite_dbs_configured):
+    source = {
+        "inp": FilteredSource(
+            ref_id="test_example_sqlite_read_db/table/data_table",
+            ref_id_type="SOURCE",
+        )
+    }
+    dataframe = (await load_data(source, adapter_key="sql-adapter"))["inp"]
+
+    db_config = get_configured_dbs_by_key()["test_example_sqlite_read_db"]
+    with mock.patch.object(db_config, "downcast_dtypes", True):
+        downcast_dataframe = (await load_data(source, adapter_key="sql-adapter"))["inp"]
+
+    assert (
+        downcast_dataframe.memory_usage(deep=True).sum()
+        <= dataframe.memory_usage(deep=True).sum()
+    )
+    pd.testing.assert_frame_equal(
+        downcast_dataframe.astype(dataframe.dtypes.to_dict()), dataframe
+    )
+
+
+@pytest.mark.asyncio
+async def test_result_caching_and_write_invalidation(two_sqlite_dbs_configured):
+    source = {
+        "inp": FilteredSource(
+            ref_id="test_writable_temp_sqlite_db/table/append_alert_table",
+            ref_id_type="SOURCE",
+        )
+    }
+    sink = {
+        "outp": FilteredSink(
+            ref_id="test_writable_temp_sqlite_db/append_table/append_alert_table",
+            ref_id_type="SINK",
+        )
+    }
+    dataframe = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    db_config = get_configured_dbs_by_key()["test_writable_temp_sqlite_db"]
+    with mock.patch.object(db_config, "cache_ttl_s", 60.0):
+        await send_data(sink, {"outp": dataframe}, adapter_key="sql-adapter")
+
+        first_load = (await load_data(source, adapter_key="sql-adapter"))["inp"]
+
+        # second load within the ttl is served from the cache
+        with mock.patch(
+            "hetdesrun.adapters.sql_adapter.load_table.read_sql_table"
+        ) as mocked_read:
+            second_load = (await load_data(source, adapter_key="sql-adapter"))["inp"]
+        mocked_read.assert_not_called()
+        pd.testing.assert_frame_equal(second_load, first_load)
+
+        # writing through the adapter invalidates the cached result
+        await send_data(sink, {"outp": dataframe}, adapter_key="sql-adapter")
+        third_load = (await load_data(source, adapter_key="sql-adapter"))["inp"]
+
+    assert len(third_load) == 2 * len(first_load)
+
+
+@pytest.mark.asyncio
+async def test_load_query_without_sql_query_filter(two_sqlite_dbs_configured):
+    with pytest.raises(AdapterHandlingException, match="no sql_query filter"):
+        await load_data(
+            {
+                "inp": FilteredSource(
+                    ref_id="test_example_sqlite_read_db/query",
+                    ref_id_type="SOURCE",
+                    filters={},
+                )
+            },
+            adapter_key="sql-adapter",
+        )
+
+
 @pytest.mark.asyncio
 async def test_load_query_table(two_sqlite_dbs_configured):
     received_data = await load_data(
@@ -21,6 +120,51 @@ async def test_load_query_table(two_sqlite_dbs_configured):
     assert received_data["inp"].columns == ["a"]
 
 
+@pytest.mark.asyncio
+async def test_load_query_with_params(two_sqlite_dbs_configured):
+    received_data = await load_data(
+        {
+            "inp": FilteredSource(
+                ref_id="test_example_sqlite_read_db/query",
+                ref_id_type="SOURCE",
+                filters={
+                    "sql_query": "SELECT a FROM data_table WHERE a >= :min_a",
+                    "sql_query_params": '{"min_a": 2}',
+                },
+            )
+        },
+        adapter_key="sql-adapter",
+    )
+
+    assert received_data["inp"]["a"].tolist() == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_load_multi_statement_query_rejected(two_sqlite_dbs_configured):
+    source = {
+        "inp": FilteredSource(
+            ref_id="test_example_sqlite_read_db/query",
+            ref_id_type="SOURCE",
+            filters={"sql_query": "SELECT a FROM data_table; DROP TABLE data_table"},
+        )
+    }
+    with pytest.raises(AdapterHandlingException, match="Multi statement"):
+        await load_data(source, adapter_key="sql-adapter")
+
+    # semicolons inside string literals and a trailing semicolon are fine
+    received_data = await load_data(
+        {
+            "inp": FilteredSource(
+                ref_id="test_example_sqlite_read_db/query",
+                ref_id_type="SOURCE",
+                filters={"sql_query": "SELECT a, ';' FROM data_table;"},
+            )
+        },
+        adapter_key="sql-adapter",
+    )
+    assert len(received_data["inp"]) == 3
+
+
 @pytest.mark.asyncio
 async def test_roundtrip_append_table(two_sqlite_dbs_configured):
     received_data = await load_data(
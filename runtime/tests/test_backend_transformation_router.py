@@ -142,50 +142,17 @@ tr_json_component_2 = {
         "dashboard_positionings": [],
     },
 }
+# shallow overlays instead of duplicated literals / deepcopies: no test mutates
+# the nested structures of these dicts
 tr_json_component_2_update = {
-    "id": str(get_uuid_from_seed("component 2")),
-    "revision_group_id": str(get_uuid_from_seed("group of component 2")),
+    **tr_json_component_2,
     "name": "new name",
-    "description": "description of component 2",
     "category": "Test",
-    "documentation": "documentation",
-    "type": "COMPONENT",
-    "state": "RELEASED",
-    "released_timestamp": "2019-12-01T12:00:00+00:00",
-    "version_tag": "1.0.0",
-    "io_interface": {
-        "inputs": [],
-        "outputs": [],
-    },
-    "content": 'code="code"',
-    "test_wiring": {
-        "input_wirings": [],
-        "output_wirings": [],
-        "dashboard_positionings": [],
-    },
 }
 tr_json_component_2_deprecate = {
-    "id": str(get_uuid_from_seed("component 2")),
-    "revision_group_id": str(get_uuid_from_seed("group of component 2")),
-    "name": "new name",
-    "description": "description of component 2",
-    "category": "Test",
-    "documentation": "documentation",
-    "type": "COMPONENT",
+    **tr_json_component_2_update,
     "state": "DISABLED",
-    "released_timestamp": "2019-12-01T12:00:00+00:00",
     "disabled_timestamp": "2023-08-03T12:00:00+00:00",
-    "version_tag": "1.0.0",
-    "io_interface": {
-        "inputs": [],
-        "outputs": [],
-    },
-    "content": 'code="code"',
-    "test_wiring": {
-        "input_wirings": [],
-        "output_wirings": [],
-        "dashboard_positionings": [],
-    },
 }
 
 tr_json_component_3 = {
@@ -603,8 +570,10 @@ tr_json_workflow_2_with_named_io_for_operator = {
         "dashboard_positionings": [],
     },
 }
-tr_json_workflow_2_update = deepcopy(tr_json_workflow_2_with_named_io_for_operator)
-tr_json_workflow_2_update["name"] = "new name"
+tr_json_workflow_2_update = {
+    **tr_json_workflow_2_with_named_io_for_operator,
+    "name": "new name",
+}
 
 
 @pytest.mark.asyncio
@@ -1296,8 +1265,10 @@ async def test_update_transformation_revision_with_invalid_name_workflow(
         TransformationRevision(**tr_json_workflow_2_with_named_io_for_operator)
     )
 
-    tr_json_workflow_2_update_invalid_name = deepcopy(tr_json_workflow_2_update)
-    tr_json_workflow_2_update_invalid_name["name"] = "'"
+    tr_json_workflow_2_update_invalid_name = {
+        **tr_json_workflow_2_update,
+        "name": "'",
+    }
 
     async with async_test_client as ac:
         response = await ac.put(
@@ -1644,7 +1615,9 @@ async def test_execute_for_transformation_revision_without_job_id(
 
     exec_by_id_input_json = {
         "id": str(tr_workflow_2.id),
-        "wiring": json.loads(tr_workflow_2.test_wiring.json()),
+        # .dict() suffices here: WorkflowWiring only contains json-safe field
+        # types, so there is no need to round-trip through a json string
+        "wiring": tr_workflow_2.test_wiring.dict(),
     }
 
     assert hasattr(exec_by_id_input_json, "job_id") is False
@@ -0,0 +1,236 @@
+"""Documentation for component "To Long Format"
+
+# To Long Format
+
+## Description
+Convert a DataFrame in wide format into a MultiTSFrame in long format.
+
+## Inputs
+- **mtsf_in_wide_format** (DataFrame):
+  The input DataFrame in wide format. Must contain a column "timestamp" with dtype
+  datetime64[ns, UTC] without missing values. All other columns must have dtype float64.
+
+- **multiple_columns_from** (String, default value: "drop"):
+  Defines how the column names of **mtsf_in_wide_format** are interpreted. If "drop", each
+  column name is taken as a metric and the values are collected in a single column "value".
+  If "flatten", column names are expected to consist of a value column name and a metric
+  name joined by the **flattening_delimiter**, e.g. "value.a" or "longitude.b", resulting
+  in one value column per distinct first part.
+
+- **flattening_delimiter** (String, default value: "."):
+  The delimiter by which the column names are split if **multiple_columns_from** is
+  "flatten". The metric names themselves may contain the delimiter, only the first
+  occurrence splits.
+
+## Outputs
+- **mtsf_in_long_format** (MultiTSFrame):
+  The output MultiTSFrame in long format with columns "timestamp", "metric" and one column
+  per value column. Rows without any value are dropped. The frame is sorted by "timestamp"
+  and "metric".
+
+## Details
+This component is the inverse of the "To Wide Format" component.
+
+The conversion sets the timestamp as index, arranges the columns as a (value column,
+metric) MultiIndex and stacks the metric level into the rows. This produces all value
+columns in a single vectorized reshape without any joins.
+
+## Examples
+The json input of a typical call of this component is
+```
+{
+    "mtsf_in_wide_format": [
+        {
+            "timestamp": "2019-08-01T15:45:36.000Z",
+            "a": 1.0,
+            "b": 1.2
+        },
+        {
+            "timestamp": "2019-08-02T11:33:41.000Z",
+            "a": 2.0,
+            "b": null
+        }
+    ],
+    "multiple_columns_from": "drop",
+    "flattening_delimiter": "."
+}
+```
+"""
+
+import pandas as pd
+
+from hdutils import ComponentInputValidationException
+
+
+_VALIDATED_SCHEMA_ATTR = "_to_long_format_validated_schema"
+
+
+def wide_format_schema(mtsf_in_wide_format: pd.DataFrame) -> tuple:
+    """Hashable description of the schema relevant parts of a wide frame"""
+    return (
+        tuple(str(col) for col in mtsf_in_wide_format.columns),
+        tuple(str(col_dtype) for col_dtype in mtsf_in_wide_format.dtypes),
+    )
+
+
+def validate_no_missing_timestamps(mtsf_in_wide_format: pd.DataFrame) -> None:
+    # hasnans is computed without materializing a full boolean mask just to
+    # reduce it with any()
+    if mtsf_in_wide_format["timestamp"].hasnans:
+        raise ComponentInputValidationException(
+            'The column "timestamp" must not contain missing values.',
+            error_code=422,
+            invalid_component_inputs=["mtsf_in_wide_format"],
+        )
+
+
+def validate_wide_mtsf(mtsf_in_wide_format: pd.DataFrame) -> None:
+    # frames whose schema already passed validation in this workflow run (the
+    # marker travels in the frame's attrs) skip the schema checks; the NaN
+    # check is data dependent and therefore always repeated
+    schema = wide_format_schema(mtsf_in_wide_format)
+    if mtsf_in_wide_format.attrs.get(_VALIDATED_SCHEMA_ATTR) == schema:
+        validate_no_missing_timestamps(mtsf_in_wide_format)
+        return
+
+    if "timestamp" not in mtsf_in_wide_format.columns:
+        raise ComponentInputValidationException(
+            'The input dataframe must contain a column named "timestamp".',
+            error_code=422,
+            invalid_component_inputs=["mtsf_in_wide_format"],
+        )
+
+    validate_no_missing_timestamps(mtsf_in_wide_format)
+
+    # check the dtype structurally instead of comparing against the string
+    # "datetime64[ns, UTC]", which would reject equivalent tz-aware dtypes
+    # whose timezone is spelled differently
+    timestamp_dtype = mtsf_in_wide_format["timestamp"].dtype
+    if not (
+        isinstance(timestamp_dtype, pd.DatetimeTZDtype)
+        and str(timestamp_dtype.tz) == "UTC"
+    ):
+        raise ComponentInputValidationException(
+            'The column "timestamp" must have a datetime64 dtype with UTC timezone,'
+            f" but it has dtype {timestamp_dtype}.",
+            error_code=422,
+            invalid_component_inputs=["mtsf_in_wide_format"],
+        )
+
+    # operate on the O(columns) dtypes Series directly instead of dropping the
+    # timestamp column from the frame, which would copy its data blocks
+    value_dtypes = mtsf_in_wide_format.dtypes.drop("timestamp")
+    non_float_dtypes = value_dtypes[value_dtypes != "float64"]
+    if len(non_float_dtypes) != 0:
+        raise ComponentInputValidationException(
+            "All columns other than the timestamp column must have dtype float64,"
+            f" but the dtypes {set(non_float_dtypes)} occur.",
+            error_code=422,
+            invalid_component_inputs=["mtsf_in_wide_format"],
+        )
+
+    mtsf_in_wide_format.attrs[_VALIDATED_SCHEMA_ATTR] = schema
+
+
+# ***** DO NOT EDIT LINES BELOW *****
+# These lines may be overwritten if component details or inputs/outputs change.
+COMPONENT_INFO = {
+    "inputs": {
+        "mtsf_in_wide_format": {"data_type": "DATAFRAME"},
+        "multiple_columns_from": {"data_type": "STRING", "default_value": "drop"},
+        "flattening_delimiter": {"data_type": "STRING", "default_value": "."},
+    },
+    "outputs": {
+        "mtsf_in_long_format": {"data_type": "MULTITSFRAME"},
+    },
+    "name": "To Long Format",
+    "category": "Connectors",
+    "description": "Convert a DataFrame in wide format into a MultiTSFrame in long format",
+    "version_tag": "1.0.0",
+    "id": "b6147fc5-9ea5-460c-b303-233e195715ca",
+    "revision_group_id": "c456f091-0ed5-4171-9d86-c696218c7bd0",
+    "state": "RELEASED",
+    "released_timestamp": "2026-08-31T12:00:00+00:00",
+}
+
+from hdutils import parse_default_value  # noqa: E402, F401
+
+
+def main(
+    *, mtsf_in_wide_format, multiple_columns_from="drop", flattening_delimiter="."
+):
+    # entrypoint function for this component
+    # ***** DO NOT EDIT LINES ABOVE *****
+    validate_wide_mtsf(mtsf_in_wide_format)
+
+    if multiple_columns_from not in ("drop", "flatten"):
+        raise ComponentInputValidationException(
+            'The input multiple_columns_from must be either "drop" or "flatten",'
+            f' but it is "{multiple_columns_from}".',
+            error_code=422,
+            invalid_component_inputs=["multiple_columns_from"],
+        )
+
+    # no defensive deep copy of the input needed: set_index returns a new
+    # frame (sharing the value data, which is never mutated here), so
+    # rewriting its columns does not affect the caller's frame
+    stacked_df = mtsf_in_wide_format.set_index("timestamp")
+
+    if multiple_columns_from == "drop":
+        stacked_df.columns = pd.MultiIndex.from_tuples(
+            [("value", str(col)) for col in stacked_df.columns],
+            names=[None, "metric"],
+        )
+    else:
+        # split each column name exactly once and validate on the split result
+        # instead of a separate containment scan over all columns
+        split_columns = [
+            tuple(str(col).split(flattening_delimiter, 1)) for col in stacked_df.columns
+        ]
+        if any(len(column_parts) == 1 for column_parts in split_columns):
+            raise ComponentInputValidationException(
+                "All columns other than the timestamp column must contain the"
+                f' flattening delimiter "{flattening_delimiter}" if'
+                ' multiple_columns_from is "flatten".',
+                error_code=422,
+                invalid_component_inputs=["mtsf_in_wide_format"],
+            )
+        stacked_df.columns = pd.MultiIndex.from_tuples(
+            split_columns, names=[None, "metric"]
+        )
+
+    # stacking the metric level produces all value columns in one vectorized
+    # reshape; stack drops rows for which all value columns are NaN
+    melted_mtsf = stacked_df.stack(level="metric").reset_index()  # noqa: PD013
+
+    melted_mtsf = melted_mtsf.sort_values(by=["timestamp", "metric"]).reset_index(
+        drop=True
+    )
+
+    return {"mtsf_in_long_format": melted_mtsf}
+
+
+TEST_WIRING_FROM_PY_FILE_IMPORT = {
+    "input_wirings": [
+        {
+            "workflow_input_name": "mtsf_in_wide_format",
+            "adapter_id": "direct_provisioning",
+            "filters": {
+                "value": (
+                    "[\n"
+                    "    {\n"
+                    '        "timestamp": "2019-08-01T15:45:36.000Z",\n'
+                    '        "a": 1.0,\n'
+                    '        "b": 1.2\n'
+                    "    },\n"
+                    "    {\n"
+                    '        "timestamp": "2019-08-02T11:33:41.000Z",\n'
+                    '        "a": 2.0,\n'
+                    '        "b": null\n'
+                    "    }\n"
+                    "]"
+                )
+            },
+        }
+    ]
+}
@@ -0,0 +1,160 @@
+"""Documentation for component "To Wide Format"
+
+# To Wide Format
+
+## Description
+Convert a MultiTSFrame in long format into a DataFrame in wide format.
+
+## Inputs
+- **mtsf_in_long_format** (MultiTSFrame):
+  The input MultiTSFrame in long format with columns "timestamp", "metric" and one or more
+  value columns. Each combination of timestamp and metric must occur at most once.
+
+- **handle_multiple_columns** (String, default value: "drop"):
+  Defines how multiple value columns are handled. If "drop", only the column "value" is
+  kept and each metric results in one output column named like the metric. If "flatten",
+  all value columns are kept and each pair of value column and metric results in one
+  output column whose name is both names joined by the **flattening_delimiter**, e.g.
+  "value.a" or "longitude.b".
+
+- **flattening_delimiter** (String, default value: "."):
+  The delimiter with which the column names are joined if **handle_multiple_columns** is
+  "flatten".
+
+## Outputs
+- **mtsf_in_wide_format** (DataFrame):
+  The output DataFrame in wide format with a column "timestamp" and one column per metric
+  (and value column). The frame is sorted by "timestamp".
+
+## Details
+This component is the inverse of the "To Long Format" component.
+
+## Examples
+The json input of a typical call of this component is
+```
+{
+    "mtsf_in_long_format": {
+        "value": [1.0, 1.2, 2.0],
+        "metric": ["a", "b", "a"],
+        "timestamp": [
+            "2019-08-01T15:45:36.000Z",
+            "2019-08-01T15:45:36.000Z",
+            "2019-08-02T11:33:41.000Z"
+        ]
+    },
+    "handle_multiple_columns": "drop",
+    "flattening_delimiter": "."
+}
+```
+"""
+
+from hdutils import ComponentInputValidationException
+
+# ***** DO NOT EDIT LINES BELOW *****
+# These lines may be overwritten if component details or inputs/outputs change.
+COMPONENT_INFO = {
+    "inputs": {
+        "mtsf_in_long_format": {"data_type": "MULTITSFRAME"},
+        "handle_multiple_columns": {"data_type": "STRING", "default_value": "drop"},
+        "flattening_delimiter": {"data_type": "STRING", "default_value": "."},
+    },
+    "outputs": {
+        "mtsf_in_wide_format": {"data_type": "DATAFRAME"},
+    },
+    "name": "To Wide Format",
+    "category": "Connectors",
+    "description": "Convert a MultiTSFrame in long format into a DataFrame in wide format",
+    "version_tag": "1.0.0",
+    "id": "83d8f559-fddb-414e-b644-a01e62af6d56",
+    "revision_group_id": "753e6aa2-45c4-4380-9563-473f1e557ec6",
+    "state": "RELEASED",
+    "released_timestamp": "2026-08-31T12:00:00+00:00",
+}
+
+from hdutils import parse_default_value  # noqa: E402, F401
+
+
+def main(
+    *, mtsf_in_long_format, handle_multiple_columns="drop", flattening_delimiter="."
+):
+    # entrypoint function for this component
+    # ***** DO NOT EDIT LINES ABOVE *****
+    if handle_multiple_columns not in ("drop", "flatten"):
+        raise ComponentInputValidationException(
+            'The input handle_multiple_columns must be either "drop" or "flatten",'
+            f' but it is "{handle_multiple_columns}".',
+            error_code=422,
+            invalid_component_inputs=["handle_multiple_columns"],
+        )
+
+    # dictionary-encode the metric strings so that the reshape machinery works
+    # on integer category codes instead of hashing N utf-8 strings; assign
+    # returns a new frame, the caller's metric column stays untouched
+    mtsf_in_long_format = mtsf_in_long_format.assign(
+        metric=mtsf_in_long_format["metric"].astype("category")
+    )
+
+    if handle_multiple_columns == "drop":
+        # fast path for the default case: a single value column yields a
+        # single level column index, so the value column scan and the
+        # multi-level label handling can be skipped entirely
+        # (unstack on a pre-set (timestamp, metric) MultiIndex reuses that
+        # index's factorization, while pivot would factorize the key columns
+        # again)
+        pivoted_df = (
+            mtsf_in_long_format.set_index(["timestamp", "metric"])["value"]  # noqa: PD010
+            .unstack("metric")
+            .rename_axis(columns=None)
+        )
+        # adjust the dtype of the few column labels instead of casting all N
+        # metric cells to object before pivoting
+        pivoted_df.columns = pivoted_df.columns.astype(object)
+        pivoted_df = pivoted_df.reset_index()
+
+        if not pivoted_df["timestamp"].is_monotonic_increasing:
+            pivoted_df = pivoted_df.sort_values(by="timestamp").reset_index(drop=True)
+
+        return {"mtsf_in_wide_format": pivoted_df}
+
+    value_cols = [
+        col for col in mtsf_in_long_format.columns if col not in ("timestamp", "metric")
+    ]
+
+    pivoted_df = mtsf_in_long_format.set_index(["timestamp", "metric"])[  # noqa: PD010
+        value_cols
+    ].unstack("metric")
+
+    pivoted_df.columns = pivoted_df.columns.to_flat_index().map(
+        flattening_delimiter.join
+    )
+    pivoted_df = pivoted_df.reset_index()
+
+    # unstack already emits the timestamps in sorted order, so the sort only
+    # runs in the exceptional case of a non-monotonic result
+    if not pivoted_df["timestamp"].is_monotonic_increasing:
+        pivoted_df = pivoted_df.sort_values(by="timestamp").reset_index(drop=True)
+
+    return {"mtsf_in_wide_format": pivoted_df}
+
+
+TEST_WIRING_FROM_PY_FILE_IMPORT = {
+    "input_wirings": [
+        {
+            "workflow_input_name": "mtsf_in_long_format",
+            "adapter_id": "direct_provisioning",
+            "filters": {
+                "value": (
+                    "{\n"
+                    '    "value": [1.0, 1.2, 2.0],\n'
+                    '    "metric": ["a", "b", "a"],\n'
+                    '    "timestamp": [\n'
+                    '        "2019-08-01T15:45:36.000Z",\n'
+                    '        "2019-08-01T15:45:36.000Z",\n'
+                    '        "2019-08-02T11:33:41.000Z"\n'
+                    "    ]\n"
+                    "}"
+                )
+            },
+        }
+    ]
+}